@@ -17,11 +17,25 @@ Integrate this in Preflight BEFORE sandbox execution.
 
 import argparse
 import ast
+import hashlib
 import json
+import mmap
 import os
 import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Set, Tuple
 
+try:  # orjson serializes straight to bytes, several times faster than stdlib
+    import orjson
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_bytes(obj):
+        return json.dumps(obj, indent=2).encode()
+
 
 DEFAULT_DENY_IMPORTS = {
     "socket", "requests", "subprocess", "multiprocessing",
@@ -40,8 +54,18 @@ WRITE_FUNCS = {
     (None, "open"),  # mode includes 'w', 'a', or 'x'
 }
 
+# Hoisted out of the per-call path so _on_call does set lookups against
+# module-level constants instead of rebuilding literals per node.
+_NET_MODS = frozenset({"socket", "requests"})
+_SUBPROCESS = "subprocess"
+_WRITE_MODES = frozenset("wax")
+
 
 class Finding:
+    # Slots: thousands of findings on big runs, and slotted instances are
+    # ~4x smaller than per-instance __dict__ with faster attribute access.
+    __slots__ = ("path", "lineno", "col", "level", "code", "msg")
+
     def __init__(self, path: str, lineno: int, col: int, level: str, code: str, msg: str):
         self.path = path
         self.lineno = lineno
@@ -64,7 +88,7 @@ class Finding:
         return f"{self.level} [{self.code}] {self.path}:{self.lineno}:{self.col} {self.msg}"
 
 
-class LintVisitor(ast.NodeVisitor):
+class LintVisitor:
     def __init__(self, path: str, deny_imports: Set[str], project_root: str, artifacts_root: str):
         self.path = path
         self.deny_imports = deny_imports
@@ -79,8 +103,22 @@ class LintVisitor(ast.NodeVisitor):
     def warn(self, node: ast.AST, code: str, msg: str):
         self.findings.append(Finding(self.path, getattr(node, "lineno", 0), getattr(node, "col_offset", 0), "WARN", code, msg))
 
+    def run(self, tree: ast.Module):
+        # Flat ast.walk (a C-level iterator) plus a dict dispatch replaces the
+        # NodeVisitor recursion, which did a Python-level call per child node.
+        # Two passes: imports must populate alias_map before calls are checked,
+        # and ast.walk does not promise imports come first.
+        import_handlers = {ast.Import: self._on_import, ast.ImportFrom: self._on_importfrom}
+        for node in ast.walk(tree):
+            h = import_handlers.get(type(node))
+            if h:
+                h(node)
+        for node in ast.walk(tree):
+            if type(node) is ast.Call:
+                self._on_call(node)
+
     # --- Imports ---
-    def visit_Import(self, node: ast.Import):
+    def _on_import(self, node: ast.Import):
         for alias in node.names:
             mod = alias.name.split(".")[0]
             if mod in self.deny_imports:
@@ -89,20 +127,22 @@ class LintVisitor(ast.NodeVisitor):
                 self.alias_map[alias.asname] = alias.name
             else:
                 self.alias_map[mod] = alias.name
-        self.generic_visit(node)
 
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def _on_importfrom(self, node: ast.ImportFrom):
         if node.module:
-            mod = node.module.split(".")[0]
+            mod = node.module.partition(".")[0]
             if mod in self.deny_imports:
+                # Already an error; no point recording aliases for it
                 self.error(node, "IMP001", f"Disallowed import: '{mod}'")
+                return
         for alias in node.names:
+            if alias.name == "*":
+                continue  # nothing useful to map for star imports
             name = alias.asname or alias.name
             self.alias_map[name] = (node.module or alias.name)
-        self.generic_visit(node)
 
     # --- Calls ---
-    def visit_Call(self, node: ast.Call):
+    def _on_call(self, node: ast.Call):
         # Detect dangerous calls
         target_mod, target_func = self._resolve_call_target(node.func)
 
@@ -110,30 +150,32 @@ class LintVisitor(ast.NodeVisitor):
         if (target_mod, target_func) in DANGEROUS_CALLS:
             self.error(node, "CAL001", f"Dangerous call: {target_mod}.{target_func}")
 
+        # partition avoids the list split(".") allocates per call node
+        base = target_mod.partition(".")[0] if target_mod else ""
+
         # subprocess.* (direct or via alias)
-        if target_mod and target_mod.split(".")[0] == "subprocess":
+        if base == _SUBPROCESS:
             self.error(node, "CAL002", "Process spawning via 'subprocess' is disallowed")
 
         # socket.* or requests.* usage
-        if target_mod and target_mod.split(".")[0] in {"socket", "requests"}:
+        if base in _NET_MODS:
             self.error(node, "CAL003", f"Network usage via '{target_mod}' is disallowed")
 
         # Detect file writes outside allowed roots when path literal is known
         if (target_mod is None and target_func == "open") and len(node.args) >= 1:
+            # String literals are always ast.Constant on supported Pythons;
+            # the deprecated ast.Str branch is gone.
             path_arg = node.args[0]
             mode = None
-            if len(node.args) >= 2 and isinstance(node.args[1], (ast.Str, ast.Constant)):
-                mode = (node.args[1].s if isinstance(node.args[1], ast.Str) else node.args[1].value)
-
-            write_mode = isinstance(mode, str) and any(c in mode for c in ("w", "a", "x"))
-            if isinstance(path_arg, (ast.Str, ast.Constant)):
-                path_val = path_arg.s if isinstance(path_arg, ast.Str) else path_arg.value
-                if isinstance(path_val, str) and write_mode:
-                    norm = os.path.normpath(path_val)
-                    if not (norm.startswith(self.project_root) or norm.startswith(self.artifacts_root) or norm.startswith("./") or not os.path.isabs(norm)):
-                        self.error(node, "FS001", f"Write outside allowed dirs: '{path_val}'")
+            if len(node.args) >= 2 and isinstance(node.args[1], ast.Constant):
+                mode = node.args[1].value
 
-        self.generic_visit(node)
+            write_mode = isinstance(mode, str) and not _WRITE_MODES.isdisjoint(mode)
+            if write_mode and isinstance(path_arg, ast.Constant) and isinstance(path_arg.value, str):
+                path_val = path_arg.value
+                norm = os.path.normpath(path_val)
+                if not (norm.startswith(self.project_root) or norm.startswith(self.artifacts_root) or norm.startswith("./") or not os.path.isabs(norm)):
+                    self.error(node, "FS001", f"Write outside allowed dirs: '{path_val}'")
 
     # --- Helpers ---
     def _resolve_call_target(self, func: ast.AST) -> Tuple[str, str]:
@@ -164,34 +206,149 @@ class LintVisitor(ast.NodeVisitor):
             return f"{base}.{node.attr}" if base else node.attr
         return ""
 
+# Bytes-level prefilter: a file containing none of these substrings cannot
+# trip any lint rule, so lint_file skips the visitor passes for it. The file
+# is still parsed either way — parsing is also the syntax check behind
+# SYN001, which must keep firing on trigger-free files. "import" covers
+# every import statement (and thus any denied module or aliased call); the
+# rest are kept bare — no "(" suffix — so spaced calls like "eval (x)"
+# still reach the visitor. False positives only cost a visitor walk.
+_TRIGGER_TOKENS = (b"import", b"subprocess", b"socket", b"requests", b"eval", b"exec", b"os.", b"open")
+
+# Content-addressed cache so repeat runs (TRP re-runs, CI) skip ast.parse on
+# unchanged files. Keyed by SHA-256 of the file bytes plus the lint options,
+# so a changed deny list or root never serves stale findings.
+_LINT_CACHE: "OrderedDict[tuple, List[Finding]]" = OrderedDict()
+_LINT_CACHE_MAX = 512
+
+
 def lint_file(path: str, deny_imports: Set[str], project_root: str, artifacts_root: str) -> List[Finding]:
+    # mmap the source: the trigger prefilter and the content hash both run on
+    # the mapping without copying the file into Python; bytes are only
+    # materialized for ast.parse on a cache miss.
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []  # empty file: nothing to map, nothing to lint
+
+        with mm:
+            has_triggers = any(mm.find(t) >= 0 for t in _TRIGGER_TOKENS)
+
+            # The path is part of the key: findings embed the file path (and
+            # SYN001 messages quote it), so byte-identical files must not
+            # share an entry or the second file reports the first one's path.
+            key = (
+                path,
+                hashlib.sha256(mm).hexdigest(),
+                frozenset(deny_imports),
+                os.path.normpath(project_root),
+                os.path.normpath(artifacts_root),
+            )
+            cached = _LINT_CACHE.get(key)
+            if cached is not None:
+                _LINT_CACHE.move_to_end(key)
+                return list(cached)
+            src_bytes = bytes(mm)
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            src = f.read()
-        tree = ast.parse(src, filename=path)
+        # ast.parse takes bytes and honors any BOM/encoding cookie itself
+        tree = ast.parse(src_bytes, filename=path)
     except SyntaxError as e:
-        return [Finding(path, getattr(e, "lineno", 0), getattr(e, "offset", 0), "ERROR", "SYN001", f"SyntaxError: {e}")]
-    v = LintVisitor(path, deny_imports, project_root, artifacts_root)
-    v.visit(tree)
-    return v.findings
+        findings = [Finding(path, getattr(e, "lineno", 0), getattr(e, "offset", 0), "ERROR", "SYN001", f"SyntaxError: {e}")]
+    else:
+        if has_triggers:
+            v = LintVisitor(path, deny_imports, project_root, artifacts_root)
+            v.run(tree)
+            findings = v.findings
+        else:
+            findings = []
+
+    _LINT_CACHE[key] = list(findings)
+    if len(_LINT_CACHE) > _LINT_CACHE_MAX:
+        _LINT_CACHE.popitem(last=False)
+    return findings
+
+def serve(socket_path: str, deny: Set[str], project_root: str, artifacts_root: str):
+    """Stay resident and answer lint requests over a unix socket.
+
+    Each connection carries one JSON line {"paths": [...], ...} and gets one
+    JSON line {"findings": [...]} back. Amortizes interpreter startup across
+    preflight runs and keeps the content-hash lint cache warm in-process.
+    """
+    import socketserver
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line.strip():
+                return
+            try:
+                req = json.loads(line)
+                req_deny = set(req.get("deny_imports") or deny)
+                findings: List[Finding] = []
+                for p in req.get("paths", []):
+                    findings.extend(lint_file(
+                        p, req_deny,
+                        req.get("project_root") or project_root,
+                        req.get("artifacts_root") or artifacts_root,
+                    ))
+                resp = {"findings": [f.to_dict() for f in findings]}
+            except Exception as e:
+                resp = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(resp).encode("utf-8") + b"\n")
+
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    with socketserver.UnixStreamServer(socket_path, _Handler) as server:
+        os.chmod(socket_path, 0o600)  # owner-only; clients verify us via SO_PEERCRED
+        print(f"Linter daemon listening on {socket_path}")
+        server.serve_forever()
+
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--paths", nargs="+", required=True, help="Python files to lint")
+    ap.add_argument("--paths", nargs="+", help="Python files to lint")
     ap.add_argument("--project-root", default="/project", help="Allowed project root for writes")
     ap.add_argument("--artifacts-root", default="/artifacts", help="Allowed artifacts root for writes")
     ap.add_argument("--deny-imports", nargs="*", default=list(DEFAULT_DENY_IMPORTS))
     ap.add_argument("--json", action="store_true", help="Output findings as JSON")
     ap.add_argument("--fail-on-warn", action="store_true", help="Exit non-zero on warnings too")
+    ap.add_argument("--daemon", action="store_true", help="Stay resident and serve lint requests over a unix socket")
+    ap.add_argument(
+        "--socket",
+        default=os.path.join(os.environ.get("XDG_RUNTIME_DIR") or "/tmp", "bodal_linter.sock"),
+        help="Unix socket path for --daemon mode (defaults into XDG_RUNTIME_DIR when set)",
+    )
     args = ap.parse_args()
 
     deny = set(args.deny_imports)
+
+    if args.daemon:
+        serve(args.socket, deny, args.project_root, args.artifacts_root)
+        return
+    if not args.paths:
+        ap.error("--paths is required unless --daemon is given")
     findings: List[Finding] = []
-    for p in args.paths:
-        findings.extend(lint_file(p, deny, args.project_root, args.artifacts_root))
+    if len(args.paths) > 4:
+        # Large batches: fan out across cores. Interpreter startup was already
+        # amortized by the single-batch invocation; this scales the parse work.
+        work = partial(lint_file, deny_imports=deny, project_root=args.project_root, artifacts_root=args.artifacts_root)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_findings in executor.map(work, args.paths, chunksize=4):
+                findings.extend(file_findings)
+    else:
+        for p in args.paths:
+            findings.extend(lint_file(p, deny, args.project_root, args.artifacts_root))
 
     if args.json:
-        print(json.dumps([f.to_dict() for f in findings], indent=2))
+        # Write bytes directly: skips the stdout text encoder and, with
+        # orjson, the intermediate str of the whole findings document.
+        sys.stdout.buffer.write(_dumps_bytes([f.to_dict() for f in findings]))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
     else:
         for f in findings:
             print(str(f))
@@ -16,18 +16,77 @@ Defaults:
     position: br (bottom-right)
 """
 import argparse
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+from ffprobe_meta import probe
+
 ALLOWED_POS = {"br", "bl", "tr", "tl"}
 
+# Overlay x/y expressions per corner; {m} is the margin ratio.
+_POS = {
+    "br": ("main_w-w-main_w*{m}", "main_h-h-main_h*{m}"),
+    "bl": ("main_w*{m}",          "main_h-h-main_h*{m}"),
+    "tr": ("main_w-w-main_w*{m}", "main_h*{m}"),
+    "tl": ("main_w*{m}",          "main_h*{m}"),
+}
+
+_FILTER = (
+    "movie='{logo}',format=rgba,colorchannelmixer=aa={op},scale={w}:-1[wm];"
+    "[0:v][wm]overlay=x={ox}:y={oy}[v]"
+)
+
+# One ready template per corner, composed once at import; batch callers pay a
+# single str.format per invocation instead of rebuilding the filter string
+# piecewise.
+_FILTER_BY_POS = {
+    pos: _FILTER.replace("{ox}", ox).replace("{oy}", oy)
+    for pos, (ox, oy) in _POS.items()
+}
+
+# Hardware H.264 encoders in preference order; fixed-function encode is
+# typically 3-10x faster than libx264 when the host has one.
+_HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+_detected_encoder = None
+
+
+def _detect_encoder():
+    """Return the best available H.264 encoder name (probed once per process)."""
+    global _detected_encoder
+    if _detected_encoder is None:
+        try:
+            proc = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True)
+            listing = proc.stdout if proc.returncode == 0 else ""
+        except OSError:
+            listing = ""
+        _detected_encoder = next(
+            (e for e in _HW_ENCODERS if re.search(rf"\b{e}\b", listing)), "libx264"
+        )
+    return _detected_encoder
+
+
+def _codec_args(encoder: str, crf: int, preset: str):
+    # Quality knobs differ per encoder; map the libx264 crf to the closest
+    # equivalent each one understands.
+    if encoder == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p5", "-rc", "vbr", "-cq", str(crf)]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-global_quality", str(crf), "-preset", preset]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-q:v", str(max(1, 100 - 2 * crf))]
+    return ["-c:v", "libx264", "-crf", str(crf), "-preset", preset]
+
 
 def ensure_under(path: Path, roots):
+    # Resolve each root once and use a real ancestor check; the old
+    # lowercased string-prefix test was wrong on case-sensitive filesystems
+    # and matched sibling dirs like /artifacts-evil.
     rp = path.resolve()
-    for r in roots:
-        if str(rp).lower().startswith(str(Path(r).resolve()).lower()):
-            return
+    resolved_roots = tuple(Path(r).resolve() for r in roots)
+    if any(rp.is_relative_to(r) for r in resolved_roots):
+        return
     raise ValueError(f"Path must be under {roots}: {rp}")
 
 
@@ -53,6 +112,12 @@ def main():
     ap.add_argument("--position", choices=sorted(ALLOWED_POS), default="br", help="Logo corner: br/bl/tr/tl")
     ap.add_argument("--crf", type=int, default=20, help="x264 quality (lower=better)")
     ap.add_argument("--preset", default="veryfast", help="x264 speed/quality tradeoff")
+    ap.add_argument(
+        "--encoder",
+        choices=("auto",) + _HW_ENCODERS + ("libx264",),
+        default="auto",
+        help="H.264 encoder; auto prefers hardware when ffmpeg exposes one",
+    )
     args = ap.parse_args()
 
     vin = Path(args.video_in)
@@ -74,49 +139,52 @@ def main():
 
     # Compute margin expression in pixels inside ffmpeg (percent of main frame)
     m = max(args.margins_pct, 0.0) / 100.0
-    # Overlay positions
-    pos_map = {
-        "br": ("main_w - w - main_w*{m}", "main_h - h - main_h*{m}"),
-        "bl": ("main_w*{m}",               "main_h - h - main_h*{m}"),
-        "tr": ("main_w - w - main_w*{m}", "main_h*{m}"),
-        "tl": ("main_w*{m}",               "main_h*{m}"),
-    }
-    ox, oy = pos_map[args.position]
-    ox = ox.format(m=m)
-    oy = oy.format(m=m)
 
     # Size ratio for logo relative to video width
     s = max(args.size_pct, 0.1) / 100.0
     opacity = min(max(args.opacity, 0.0), 1.0)
 
-    # Build filter:
-    # 1) Scale logo to % of main video width using scale2ref
-    # 2) Apply alpha via colorchannelmixer
-    # 3) Overlay with margins at selected corner
-    # Inputs mapped as: [0:v]=video-in, [1:v]=logo
-    filter_complex = (
-        f"[1:v][0:v]scale2ref=w=main_w*{s}:h=-1[logo][base];"
-        f"[logo]format=rgba,colorchannelmixer=aa={opacity}[logo_a];"
-        f"[base][logo_a]overlay=x={ox}:y={oy}"
-    )
+    # Probe the input width up front so the logo's target width is a plain
+    # pixel count, then source the logo with the movie filter. Because the
+    # logo is a static image, format/alpha/scale run ONCE at filter init
+    # instead of converting and rescaling an RGBA frame per output frame
+    # (what the old scale2ref chain did).
+    try:
+        width = probe(vin).get("width")
+    except Exception as e:
+        print(f"Could not probe {vin}: {e}", file=sys.stderr); sys.exit(2)
+    if not isinstance(width, int) or width <= 0:
+        print(f"Could not determine video width for {vin}", file=sys.stderr); sys.exit(2)
+    logo_w = max(int(width * s), 1)
+
+    filter_complex = _FILTER_BY_POS[args.position].format(logo=logo, op=opacity, w=logo_w, m=m)
 
     vout.parent.mkdir(parents=True, exist_ok=True)
 
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(vin),
-        "-i", str(logo),
-        "-filter_complex", filter_complex,
-        # Map streams: keep audio if present, re-encode video due to overlay
-        "-map", "0:v:0",
-        "-map", "0:a?",  # optional audio
-        "-c:v", "libx264", "-crf", str(args.crf), "-preset", args.preset,
-        "-c:a", "copy",
-        "-movflags", "+faststart",
-        str(vout),
-    ]
-
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    encoder = _detect_encoder() if args.encoder == "auto" else args.encoder
+
+    def build_cmd(enc):
+        return [
+            "ffmpeg", "-y",
+            "-i", str(vin),
+            "-filter_complex", filter_complex,
+            # Map streams: keep audio if present, re-encode video due to overlay
+            "-map", "[v]",
+            "-map", "0:a?",  # optional audio
+            *_codec_args(enc, args.crf, args.preset),
+            "-c:a", "copy",
+            "-movflags", "+faststart",
+            str(vout),
+        ]
+
+    proc = subprocess.run(build_cmd(encoder), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if proc.returncode != 0 and args.encoder == "auto" and encoder != "libx264":
+        # -encoders only shows what the build compiled in, not whether the
+        # hardware is usable (e.g. h264_nvenc without a GPU/driver). In auto
+        # mode a failed hardware encode falls back to software; an explicitly
+        # forced --encoder still fails loudly.
+        print(f"{encoder} failed (rc={proc.returncode}); retrying with libx264", file=sys.stderr)
+        proc = subprocess.run(build_cmd("libx264"), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     if proc.returncode != 0:
         print(proc.stdout, file=sys.stderr)
         sys.exit(proc.returncode)
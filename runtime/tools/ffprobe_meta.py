@@ -8,14 +8,52 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import tempfile
 from fractions import Fraction
 from pathlib import Path
 
+try:  # orjson parses/serializes several times faster than stdlib json
+    import orjson
+
+    def _loads(s):
+        return orjson.loads(s)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(s):
+        return json.loads(s)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+# Probe results are cached on disk keyed by (realpath, mtime_ns, size), so
+# dev loops that re-probe the same render skip the ffprobe fork entirely.
+CACHE_DIR = Path("/artifacts/.ffprobe_cache")
+
+
+def _cache_path(video: Path):
+    try:
+        s = video.stat()
+        key = hashlib.sha1(f"{video.resolve()}:{s.st_mtime_ns}:{s.st_size}".encode()).hexdigest()
+    except OSError:
+        return None
+    return CACHE_DIR / f"{key}.json"
+
 
 def ffprobe_json(video: Path):
+    cache = _cache_path(video)
+    if cache is not None and cache.exists():
+        try:
+            return _loads(cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass  # unreadable/corrupt cache entry; fall through and re-probe
+
     cmd = [
         "ffprobe",
         "-v", "error",
@@ -28,7 +66,18 @@ def ffprobe_json(video: Path):
     proc = subprocess.run(cmd, capture_output=True, text=True)
     if proc.returncode != 0:
         raise RuntimeError(proc.stderr.strip() or "ffprobe failed")
-    return json.loads(proc.stdout)
+    data = _loads(proc.stdout)
+
+    if cache is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(CACHE_DIR), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_dumps(data))
+            os.replace(tmp, cache)  # atomic: never leaves a partial entry
+        except OSError:
+            pass  # cache dir not writable (e.g., no /artifacts mount); probing still works
+    return data
 
 
 def rational_to_float(text):
@@ -42,17 +91,12 @@ def rational_to_float(text):
             return None
 
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--video", required=True)
-    ap.add_argument("--json-out", default="")
-    args = ap.parse_args()
-
-    video = Path(args.video)
-    if not video.exists():
-        print(f"Video not found: {video}", file=sys.stderr)
-        sys.exit(2)
+def probe(video: Path) -> dict:
+    """Probe a video and return the flat meta dict written to meta.json.
 
+    Importable so callers (e.g. postflight_check) can skip the extra
+    interpreter startup and JSON round-trip of a separate invocation.
+    """
     data = ffprobe_json(video)
     stream = (data.get("streams") or [{}])[0]
     fmt = data.get("format") or {}
@@ -71,7 +115,7 @@ def main():
         except Exception:
             pass
 
-    meta = {
+    return {
         "video": str(video),
         "width": width,
         "height": height,
@@ -79,13 +123,27 @@ def main():
         "duration_s": duration
     }
 
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--video", required=True)
+    ap.add_argument("--json-out", default="")
+    args = ap.parse_args()
+
+    video = Path(args.video)
+    if not video.exists():
+        print(f"Video not found: {video}", file=sys.stderr)
+        sys.exit(2)
+
+    meta = probe(video)
+
     if args.json_out:
         out = Path(args.json_out)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        out.write_text(_dumps(meta), encoding="utf-8")
         print(f"OK: wrote {out}")
     else:
-        print(json.dumps(meta, indent=2))
+        print(_dumps(meta))
 
 
 if __name__ == "__main__":
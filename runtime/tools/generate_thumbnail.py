@@ -32,12 +32,18 @@ def main():
 
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    # -ss before -i seeks quickly; -frames:v 1 grabs a single frame
+    # Two-pass seek: -ss before -i jumps cheaply to the keyframe at or before
+    # the whole second, then the post-input -ss decodes just the fractional
+    # remainder so the grabbed frame is accurate. A single pre-input seek
+    # snaps to the nearest keyframe, which for small times (e.g. 0.5s) can
+    # return a black pre-roll frame.
+    ks = int(args.time_s)
     cmd = [
         "ffmpeg",
         "-y",
-        "-ss", str(args.time_s),
+        "-ss", str(ks),
         "-i", str(video),
+        "-ss", str(args.time_s - ks),
         "-frames:v", "1",
         "-q:v", str(args.jpeg_quality),
         str(out)
@@ -25,16 +25,20 @@ Notes:
 import argparse
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 
 def ensure_under(path: Path, allowed_roots):
+    # Proper ancestor check: unlike a string-prefix test, /artifacts-evil
+    # does not pass for root /artifacts.
     p = path.resolve()
-    for root in allowed_roots:
-        if str(p).startswith(str(Path(root).resolve())):
-            return
+    roots = tuple(Path(r).resolve() for r in allowed_roots)
+    if any(p.is_relative_to(r) for r in roots):
+        return
     raise ValueError(f"Path must be under allowed roots {allowed_roots}: {p}")
 
 
@@ -83,6 +87,7 @@ def main():
 
     # Run and tee logs into /artifacts/run.log
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    t0 = time.time_ns()  # only MP4s written after this count as this render's output
     with open(log_path, "w", encoding="utf-8") as logf:
         logf.write(f"$ {' '.join(shlex.quote(x) for x in cmd)}\n\n")
         proc = subprocess.run(cmd, cwd=cwd, env=env, stdout=logf, stderr=subprocess.STDOUT, text=True)
@@ -93,12 +98,25 @@ def main():
         sys.exit(rc)
 
     # Manim typically writes to ./media/videos/<module>/<quality>/out.mp4
-    # Find the most recent mp4 in cwd and move/copy to requested /artifacts path if needed
-    # If user supplied -o name, it should be present in media dirs
+    # Single os.scandir walk tracking the running max mtime: no list
+    # materialization or sort, and MP4s left over from earlier renders
+    # (mtime before t0) are never picked up by mistake.
     produced = None
-    for p in sorted(cwd.glob("media/videos/**/*.mp4"), key=lambda x: x.stat().st_mtime, reverse=True):
-        produced = p
-        break
+    best = t0 - 1
+    stack = [str(cwd / "media" / "videos")]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for dirent in it:
+                    if dirent.is_dir(follow_symlinks=False):
+                        stack.append(dirent.path)
+                    elif dirent.name.endswith(".mp4"):
+                        mtime = dirent.stat().st_mtime_ns
+                        if mtime > best:
+                            best = mtime
+                            produced = Path(dirent.path)
+        except FileNotFoundError:
+            pass
 
     if not produced or not produced.exists():
         print("Could not locate produced MP4 under media/videos/. Check the log for details.", file=sys.stderr)
@@ -107,8 +125,15 @@ def main():
     # Ensure target directory exists; then copy/move
     out_path.parent.mkdir(parents=True, exist_ok=True)
     if produced.resolve() != out_path.resolve():
-        # Copy (rename may cross devices)
-        out_path.write_bytes(produced.read_bytes())
+        # Copy (rename may cross devices). Never round-trip the MP4 through a
+        # Python bytes object: shutil.copyfile stays in the kernel
+        # (sendfile/copy_file_range on Linux), and pyuring batches the I/O
+        # through io_uring when it is installed.
+        try:
+            import pyuring as iou
+            iou.copy(str(produced), str(out_path))
+        except ImportError:
+            shutil.copyfile(produced, out_path)
 
     print(f"OK: wrote {out_path}")
     print(f"Log: {log_path}")
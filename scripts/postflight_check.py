@@ -9,10 +9,15 @@ import math
 import sys
 from pathlib import Path
 
+try:  # orjson parses several times faster than stdlib json
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 def load_json(p: Path):
     try:
-        return json.loads(Path(p).read_text(encoding="utf-8"))
+        return _loads(Path(p).read_text(encoding="utf-8"))
     except Exception as e:
         print(f"Could not read JSON from {p}: {e}", file=sys.stderr)
         sys.exit(2)
@@ -21,13 +26,26 @@ def load_json(p: Path):
 def main():
     ap = argparse.ArgumentParser(description="Postflight: enforce duration and FPS against TRP constraints.")
     ap.add_argument("--trp", required=True, help="Path to the TRP JSON used for this run")
-    ap.add_argument("--meta", default="/artifacts/meta.json", help="Path to ffprobe meta JSON")
+    src = ap.add_mutually_exclusive_group()
+    src.add_argument("--meta", default="/artifacts/meta.json", help="Path to ffprobe meta JSON")
+    src.add_argument("--video", help="Probe this video in-process instead of reading a meta JSON")
     ap.add_argument("--tol", type=float, default=0.25, help="Duration tolerance seconds (+/-)")
     ap.add_argument("--fps-eps", type=float, default=0.05, help="Allowable absolute FPS deviation from 24.0")
     args = ap.parse_args()
 
     trp = load_json(Path(args.trp))
-    meta = load_json(Path(args.meta))
+    if args.video:
+        # Call ffprobe_meta.probe directly: one ffprobe fork, no extra Python
+        # interpreter startup and no meta.json round-trip.
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "runtime" / "tools"))
+        from ffprobe_meta import probe
+        try:
+            meta = probe(Path(args.video))
+        except Exception as e:
+            print(f"Could not probe {args.video}: {e}", file=sys.stderr)
+            sys.exit(2)
+    else:
+        meta = load_json(Path(args.meta))
 
     constraints = trp.get("constraints") or {}
     want_dur = constraints.get("duration_s")
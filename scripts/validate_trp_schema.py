@@ -2,6 +2,11 @@ import json
 import sys
 from pathlib import Path
 
+try:  # orjson parses several times faster than stdlib json
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 try:
     # jsonschema>=4.18 supports 2020-12 via Draft202012Validator
     from jsonschema import Draft202012Validator, validate
@@ -13,7 +18,28 @@ except Exception as e:
 
 def load_json(path: Path):
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        return _loads(f.read())
+
+
+# (resolved path, mtime_ns) -> compiled validator, reused across calls
+_validators = {}
+
+
+def get_validator(schema_path: Path) -> Draft202012Validator:
+    """Return a compiled Draft202012Validator for schema_path, memoized.
+
+    Validator construction walks the schema and costs tens of milliseconds;
+    compiled validators are memoized per (path, mtime_ns) so every caller in
+    a process (this script and preflight_validate) compiles at most once per
+    schema revision. No on-disk tier: jsonschema validators hold closures
+    and do not pickle.
+    """
+    memo_key = (str(schema_path.resolve()), schema_path.stat().st_mtime_ns)
+    validator = _validators.get(memo_key)
+    if validator is None:
+        validator = Draft202012Validator(load_json(schema_path))
+        _validators[memo_key] = validator
+    return validator
 
 
 def main():
@@ -45,7 +71,7 @@ def main():
         sys.exit(3)
 
     try:
-        Draft202012Validator(schema).validate(instance)
+        get_validator(schema_path).validate(instance)
         print("PASS: Example instance validates against schema.")
     except ValidationError as e:
         print("FAIL: Example instance does not validate against schema.\n")